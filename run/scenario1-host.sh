@@ -0,0 +1,27 @@
+#!/bin/bash
+# scenario1, with all nodes hosted in one process by the launcher
+# (use `exec` instead of `host` to compare against one process per node)
+
+rm -rf ../out/input_*
+rm -rf ../out/output_*
+rm -rf ../out/*_received_from_*
+rm -rf ../log/node_*.log ../log/controller.log  # keep launcher_<mode>.log reports
+
+echo "0 3
+3 0
+3 2
+2 3
+3 1
+1 3
+0 1
+1 0
+1 2
+2 1" > ../topology
+
+echo "0 sender \"funny str\" 100
+1 100
+2 100
+3 receiver 0 100" > ../nodes
+
+../src/launcher.py host ../nodes &
+../src/controller.py 101 &
@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+
+# Starts many nodes at once instead of one `python3 node.py` per node.
+#
+#   exec: one interpreter per node, same as the scenario scripts (baseline)
+#   fork: import node.py once, then fork one child per node
+#   host: run many nodes inside each worker process, ticked together
+#
+# Every mode writes the same per-node log/input/output files as node.py.
+# A node counts as started once it is fully constructed (node.py signals this in
+# exec mode). Startup time and memory per node are then reported to stdout and
+# ../log/launcher_<mode>.log, so runs in different modes can be compared. For
+# fork/host the launcher process itself is included, since it stays alive.
+#
+# node.py still only supports ids 0..MAX_NODES-1 (fixed-size tables and dvector
+# parsing), so specs with ids outside that range are rejected before anything starts.
+
+import os, sys, time, shlex, subprocess, traceback
+
+# fork/host pay for importing node.py once; count it in their startup time
+IMPORT_BEGIN = time.monotonic()
+
+from node import Node, MAX_NODES, MAX_RANGE, READY_FD_ENV
+
+REPORT_FILE_STR = "../log/launcher_{}.log"
+INIT_ERROR_STR = (
+    "Incorrect arguments. Expected: `./launcher.py exec|fork|host spec-file [workers]`."
+    + " Each spec-file line holds the arguments of one node, e.g. `0 sender \"funny str\" 100`."
+    + f" Node ids must be in 0..{MAX_NODES - 1}."
+)
+MODES = ("exec", "fork", "host")
+NODE_PY = os.path.join(os.path.dirname(os.path.abspath(__file__)), "node.py")
+
+
+def read_specs(path: str) -> list[list[str]]:
+    # one node per line, same arguments (and quoting) as on the node.py command line
+    with sys.stdin if path == "-" else open(path, "rt") as f:
+        lines = f.readlines()
+    return [
+        [NODE_PY] + shlex.split(line)
+        for line in lines
+        if line.strip() and not line.lstrip().startswith("#")
+    ]
+
+
+def id_out_of_range(argv: list[str]) -> bool:
+    # non-integer ids are left to node.py, which reports them like it always has
+    try:
+        return int(argv[1]) not in MAX_RANGE
+    except (IndexError, ValueError):
+        return False
+
+
+def read_memory_kb(pid: int) -> tuple[int | None, int | None]:
+    # (RSS, PSS) in kB; PSS splits pages shared with forked siblings fairly
+    rss = pss = None
+    try:
+        with open(f"/proc/{pid}/status", "rt") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    rss = int(line.split()[1])
+        with open(f"/proc/{pid}/smaps_rollup", "rt") as f:
+            for line in f:
+                if line.startswith("Pss:"):
+                    pss = int(line.split()[1])
+    except (OSError, ValueError):
+        pass
+    return rss, pss
+
+
+def signal_ready(ready_fd: int, started: int) -> None:
+    # one line per child on a pipe shared by all children, short enough to be atomic
+    os.write(ready_fd, f"{os.getpid()} {started}\n".encode())
+    os.close(ready_fd)
+
+
+def run_forked(argv: list[str], ready_fd: int) -> int:
+    # a single node in a forked child, running exactly like node.py would
+    node = None
+    try:
+        node = Node(argv)
+    finally:
+        # report 0 nodes if construction bailed out
+        signal_ready(ready_fd, 1 if node else 0)
+    try:
+        node.execute()
+    finally:
+        # os._exit() skips __del__, so make sure the log reaches the disk
+        node.logfile.flush()
+    del node
+    return 0
+
+
+def run_hosted(argvs: list[list[str]], ready_fd: int | None = None) -> int:
+    # drive several nodes from a single process, one tick per second for all;
+    # a node that fails is dropped, like its own node.py process would die
+    failed = 0
+    nodes: list[Node] = []
+    for argv in argvs:
+        try:
+            nodes.append(Node(argv))
+        except SystemExit:
+            # node.py already printed/logged why; keep the others running
+            failed += 1
+        except Exception:
+            traceback.print_exc()
+            failed += 1
+    if ready_fd is not None:
+        signal_ready(ready_fd, len(nodes))
+
+    start = time.monotonic()
+    current_time = 0
+    # same as range(duration) in Node.execute(): nothing to do for duration <= 0
+    nodes = [node for node in nodes if current_time < node.duration]
+    try:
+        while nodes:
+            running = []
+            for node in nodes:
+                try:
+                    node.tick(current_time)
+                    running.append(node)
+                except Exception:
+                    traceback.print_exc()
+                    failed += 1
+            current_time += 1
+            # dropping the reference closes the log just like a finished node.py
+            nodes = [node for node in running if current_time < node.duration]
+            if nodes:
+                time.sleep(max(0.0, start + current_time - time.monotonic()))
+    finally:
+        # os._exit() skips __del__, so make sure the logs reach the disk
+        for node in nodes:
+            node.logfile.flush()
+    return 1 if failed else 0
+
+
+class Launcher:
+    def __init__(self):
+        self.mode: str = None
+        self.argvs: list[list[str]] = None
+        self.workers: int = 1
+        # pid -> number of nodes running in that process
+        self.children: dict[int, int] = dict()
+        self.popens: list[subprocess.Popen] = []
+
+        if len(sys.argv) not in (3, 4) or sys.argv[1] not in MODES:
+            print(INIT_ERROR_STR)
+            exit(1)
+
+        self.mode = sys.argv[1]
+        try:
+            self.argvs = read_specs(sys.argv[2])
+            if len(sys.argv) == 4:
+                self.workers = int(sys.argv[3])
+                assert self.workers > 0
+        except:
+            print(INIT_ERROR_STR)
+            exit(1)
+
+        for argv in self.argvs:
+            if id_out_of_range(argv):
+                print(f"Node id out of range: {shlex.join(argv[1:])}")
+                print(INIT_ERROR_STR)
+                exit(1)
+
+    def start_exec(self):
+        # baseline: a fresh interpreter per node, reporting back once constructed
+        read_fd, write_fd = os.pipe()
+        env = dict(os.environ, **{READY_FD_ENV: str(write_fd)})
+        for argv in self.argvs:
+            popen = subprocess.Popen(
+                [sys.executable] + argv, pass_fds=(write_fd,), env=env
+            )
+            self.popens.append(popen)
+            self.children[popen.pid] = 0
+        os.close(write_fd)
+        self.wait_ready(read_fd)
+
+    def start_forked(self, groups: list[list[list[str]]]):
+        # each child gets node.py already imported; it reports back once its nodes exist
+        sys.stdout.flush()
+        sys.stderr.flush()
+        read_fd, write_fd = os.pipe()
+        for group in groups:
+            pid = os.fork()
+            if pid == 0:
+                os.close(read_fd)
+                code = 1
+                try:
+                    if self.mode == "fork":
+                        code = run_forked(group[0], write_fd)
+                    else:
+                        code = run_hosted(group, write_fd)
+                except SystemExit as e:
+                    code = e.code if isinstance(e.code, int) else 1
+                except BaseException:
+                    traceback.print_exc()
+                    code = 1
+                finally:
+                    sys.stdout.flush()
+                    sys.stderr.flush()
+                    os._exit(code)
+            self.children[pid] = 0
+        os.close(write_fd)
+        self.wait_ready(read_fd)
+
+    def wait_ready(self, read_fd: int):
+        # one "pid started" line per child; EOF once every child has signalled or exited
+        with os.fdopen(read_fd, "rt") as f:
+            for line in f:
+                pid, started = map(int, line.split())
+                self.children[pid] = started
+
+    def start(self):
+        if self.mode == "exec":
+            self.start_exec()
+        elif self.mode == "fork":
+            self.start_forked([[argv] for argv in self.argvs])
+        else:
+            workers = min(self.workers, len(self.argvs)) or 1
+            self.start_forked([self.argvs[i::workers] for i in range(workers)])
+
+    def report(self, startup: float):
+        total_nodes = sum(self.children.values())
+        measured_nodes = exited = 0
+        rss_total = pss_total = 0
+        for pid, started in self.children.items():
+            if not started:
+                continue
+            rss, pss = read_memory_kb(pid)
+            if rss is None:
+                exited += 1
+                continue
+            measured_nodes += started
+            rss_total += rss
+            pss_total += pss or 0
+
+        lines = [
+            f"Mode: {self.mode}",
+            f"Processes: {len(self.children)}"
+            + ("" if self.mode == "exec" else " (+ launcher)"),
+            f"Nodes started: {total_nodes}/{len(self.argvs)}",
+            f"Startup time: {startup:.3f} s ({startup / max(total_nodes, 1) * 1000:.2f} ms per node)",
+        ]
+        if measured_nodes and self.mode != "exec":
+            # the shell starting node.py has no such process, so it counts against fork/host
+            rss, pss = read_memory_kb(os.getpid())
+            rss_total += rss or 0
+            pss_total += pss or 0
+            lines.append(f"Launcher process: {rss} kB RSS, {pss} kB PSS (included below)")
+        if measured_nodes:
+            lines.append(
+                f"RSS per node: {rss_total / measured_nodes:.0f} kB (total {rss_total} kB)"
+            )
+        if measured_nodes and pss_total:
+            lines.append(
+                f"PSS per node: {pss_total / measured_nodes:.0f} kB (total {pss_total} kB)"
+            )
+        if not os.path.isdir("/proc"):
+            lines.append("RSS per node: n/a (/proc not available)")
+        elif exited:
+            lines.append(f"Not measured: {exited} process(es) exited before the report")
+
+        report = "\n".join(lines)
+        print(report)
+        sys.stdout.flush()
+        with open(REPORT_FILE_STR.format(self.mode), "wt") as f:
+            f.write(report + "\n")
+
+    def execute(self) -> int:
+        # exec mode does not need node.py imported here, the shell approach never does
+        begin = time.monotonic() if self.mode == "exec" else IMPORT_BEGIN
+        self.start()
+        self.report(time.monotonic() - begin)
+
+        # stay around until every node is done, like the background node.py processes
+        failed = sum(self.children.values()) < len(self.argvs)
+        if self.popens:
+            for popen in self.popens:
+                failed |= popen.wait() != 0
+        else:
+            for pid in self.children:
+                _, status = os.waitpid(pid, 0)
+                failed |= os.waitstatus_to_exitcode(status) != 0
+        return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    exit(Launcher().execute())
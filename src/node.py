@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 
 
-import sys, time
+import os, sys, time
 
 LOGFILE_STR = "../log/node_{}.log"
 INFILE_STR = "../out/input_{}"
@@ -10,6 +10,7 @@ RCVFILE_STR = "../out/{R}_received_from_{S}"
 INIT_ERROR_STR = (
     "Incorrect argument length. Expected: `./node.py node-id [mode] [string] duration`."
 )
+READY_FD_ENV = "NODE_READY_FD"  # set by launcher.py to time startup
 FILE_WRITE_FAIL_STR = "Failed to write to file: {} -> will retry"
 SENDER = "sender"
 RECEIVER = "receiver"
@@ -211,7 +212,10 @@ class RoutingTable:
 
 class Node:
 
-    def __init__(self):
+    def __init__(self, argv: list[str] | None = None):
+        # argv defaults to the command line; the launcher passes it explicitly
+        if argv is None:
+            argv = sys.argv
 
         self.id = None
         self.mode = None
@@ -223,12 +227,12 @@ class Node:
         self.routing_table = None
         self.multicast_rt = None
 
-        match (len(sys.argv)):
+        match (len(argv)):
             case 3:
                 # neither sender/receiver -> only duration
                 try:
-                    self.id = int(sys.argv[1])
-                    self.duration = int(sys.argv[2])
+                    self.id = int(argv[1])
+                    self.duration = int(argv[2])
                     self.logfile = open(LOGFILE_STR.format(self.id), "wt")
                 except:
                     print(INIT_ERROR_STR)
@@ -237,24 +241,24 @@ class Node:
             case 5:
                 # node is a sender or receiver
                 try:
-                    self.id = int(sys.argv[1])
-                    self.duration = int(sys.argv[4])
+                    self.id = int(argv[1])
+                    self.duration = int(argv[4])
                     self.logfile = open(LOGFILE_STR.format(self.id), "wt")
                 except:
                     print(INIT_ERROR_STR)
                     exit(1)
 
-                self.mode = sys.argv[2]
+                self.mode = argv[2]
                 if self.mode == SENDER:
-                    self.send_string = sys.argv[3]
+                    self.send_string = argv[3]
                 elif self.mode == RECEIVER:
                     try:
-                        self.sender_id = int(sys.argv[3])
+                        self.sender_id = int(argv[3])
                     except:
-                        self.write_log(f"Invalid senderId: {sys.argv[3]}")
+                        self.write_log(f"Invalid senderId: {argv[3]}")
                         exit(1)
                 else:
-                    self.write_log(f"Invalid node mode: {sys.argv[2]}")
+                    self.write_log(f"Invalid node mode: {argv[2]}")
                     exit(1)
 
             case _:
@@ -389,16 +393,20 @@ class Node:
 
     def execute(self):
         for current_time in range(self.duration):
-            self.write_log(f"=============Processing for t={current_time}")
-            self.send_hello(current_time)
-            self.routing_table.purge_expired(current_time)
-            self.send_dvector(current_time)
-            self.send_in_distance(current_time)
-            self.refresh_parent(current_time)
-            self.send_multicast_data(current_time)
-            self.read_input_file(current_time)
+            self.tick(current_time)
             time.sleep(1)
 
+    def tick(self, current_time: int):
+        # one second worth of work, without the sleep
+        self.write_log(f"=============Processing for t={current_time}")
+        self.send_hello(current_time)
+        self.routing_table.purge_expired(current_time)
+        self.send_dvector(current_time)
+        self.send_in_distance(current_time)
+        self.refresh_parent(current_time)
+        self.send_multicast_data(current_time)
+        self.read_input_file(current_time)
+
     def __del__(self):
         if self.logfile:
             self.write_log("****END****")
@@ -564,4 +572,10 @@ class MulticastRoutingTable:
 
 
 if __name__ == "__main__":
-    Node().execute()
+    node = Node()
+    if READY_FD_ENV in os.environ:
+        # a launcher is timing startup: report that construction is done
+        ready_fd = int(os.environ[READY_FD_ENV])
+        os.write(ready_fd, f"{os.getpid()} 1\n".encode())
+        os.close(ready_fd)
+    node.execute()